@@ -8,22 +8,23 @@ Configuration via themes.ini file.
 """
 
 import argparse
-import base64
+import binascii
 import configparser
+import contextlib
+import functools
 import os
 import re
-import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
-
-# SVG icons for GitHub alerts
-ALERT_ICONS: dict[str, str] = {
-    "note": '<svg class="octicon" viewBox="0 0 16 16" width="16" height="16"><path d="M0 8a8 8 0 1 1 16 0A8 8 0 0 1 0 8Zm8-6.5a6.5 6.5 0 1 0 0 13 6.5 6.5 0 0 0 0-13ZM6.5 7.75A.75.75 0 0 1 7.25 7h1a.75.75 0 0 1 .75.75v2.75h.25a.75.75 0 0 1 0 1.5h-2a.75.75 0 0 1 0-1.5h.25v-2h-.25a.75.75 0 0 1-.75-.75ZM8 6a1 1 0 1 1 0-2 1 1 0 0 1 0 2Z"></path></svg>',
-    "tip": '<svg class="octicon" viewBox="0 0 16 16" width="16" height="16"><path d="M8 1.5c-2.363 0-4 1.69-4 3.75 0 .984.424 1.625.984 2.304l.214.253c.223.264.47.556.673.848.284.411.537.896.621 1.49a.75.75 0 0 1-1.484.211c-.04-.282-.163-.547-.37-.847a8.456 8.456 0 0 0-.542-.68c-.084-.1-.173-.205-.268-.32C3.201 7.75 2.5 6.766 2.5 5.25 2.5 2.31 4.863 0 8 0s5.5 2.31 5.5 5.25c0 1.516-.701 2.5-1.328 3.259-.095.115-.184.22-.268.319-.207.245-.383.453-.541.681-.208.3-.33.565-.37.847a.751.751 0 0 1-1.485-.212c.084-.593.337-1.078.621-1.489.203-.292.45-.584.673-.848.075-.088.147-.173.213-.253.561-.679.985-1.32.985-2.304 0-2.06-1.637-3.75-4-3.75ZM5.75 12h4.5a.75.75 0 0 1 0 1.5h-4.5a.75.75 0 0 1 0-1.5ZM6 15.25a.75.75 0 0 1 .75-.75h2.5a.75.75 0 0 1 0 1.5h-2.5a.75.75 0 0 1-.75-.75Z"></path></svg>',
-    "important": '<svg class="octicon" viewBox="0 0 16 16" width="16" height="16"><path d="M0 1.75C0 .784.784 0 1.75 0h12.5C15.216 0 16 .784 16 1.75v9.5A1.75 1.75 0 0 1 14.25 13H8.06l-2.573 2.573A1.458 1.458 0 0 1 3 14.543V13H1.75A1.75 1.75 0 0 1 0 11.25Zm1.75-.25a.25.25 0 0 0-.25.25v9.5c0 .138.112.25.25.25h2a.75.75 0 0 1 .75.75v2.19l2.72-2.72a.749.749 0 0 1 .53-.22h6.5a.25.25 0 0 0 .25-.25v-9.5a.25.25 0 0 0-.25-.25Zm7 2.25v2.5a.75.75 0 0 1-1.5 0v-2.5a.75.75 0 0 1 1.5 0ZM9 9a1 1 0 1 1-2 0 1 1 0 0 1 2 0Z"></path></svg>',
-    "warning": '<svg class="octicon" viewBox="0 0 16 16" width="16" height="16"><path d="M6.457 1.047c.659-1.234 2.427-1.234 3.086 0l6.082 11.378A1.75 1.75 0 0 1 14.082 15H1.918a1.75 1.75 0 0 1-1.543-2.575Zm1.763.707a.25.25 0 0 0-.44 0L1.698 13.132a.25.25 0 0 0 .22.368h12.164a.25.25 0 0 0 .22-.368Zm.53 3.996v2.5a.75.75 0 0 1-1.5 0v-2.5a.75.75 0 0 1 1.5 0ZM9 11a1 1 0 1 1-2 0 1 1 0 0 1 2 0Z"></path></svg>',
-    "caution": '<svg class="octicon" viewBox="0 0 16 16" width="16" height="16"><path d="M4.47.22A.749.749 0 0 1 5 0h6c.199 0 .389.079.53.22l4.25 4.25c.141.14.22.331.22.53v6a.749.749 0 0 1-.22.53l-4.25 4.25A.749.749 0 0 1 11 16H5a.749.749 0 0 1-.53-.22L.22 11.53A.749.749 0 0 1 0 11V5c0-.199.079-.389.22-.53Zm.84 1.28L1.5 5.31v5.38l3.81 3.81h5.38l3.81-3.81V5.31L10.69 1.5ZM8 4a.75.75 0 0 1 .75.75v3.5a.75.75 0 0 1-1.5 0v-3.5A.75.75 0 0 1 8 4Zm0 8a1 1 0 1 1 0-2 1 1 0 0 1 0 2Z"></path></svg>',
+from typing import Callable, NamedTuple, Optional
+
+# SVG path data of the octicons shown in GitHub alerts (16x16 viewBox)
+ALERT_ICON_PATHS: dict[str, str] = {
+    "note": "M0 8a8 8 0 1 1 16 0A8 8 0 0 1 0 8Zm8-6.5a6.5 6.5 0 1 0 0 13 6.5 6.5 0 0 0 0-13ZM6.5 7.75A.75.75 0 0 1 7.25 7h1a.75.75 0 0 1 .75.75v2.75h.25a.75.75 0 0 1 0 1.5h-2a.75.75 0 0 1 0-1.5h.25v-2h-.25a.75.75 0 0 1-.75-.75ZM8 6a1 1 0 1 1 0-2 1 1 0 0 1 0 2Z",
+    "tip": "M8 1.5c-2.363 0-4 1.69-4 3.75 0 .984.424 1.625.984 2.304l.214.253c.223.264.47.556.673.848.284.411.537.896.621 1.49a.75.75 0 0 1-1.484.211c-.04-.282-.163-.547-.37-.847a8.456 8.456 0 0 0-.542-.68c-.084-.1-.173-.205-.268-.32C3.201 7.75 2.5 6.766 2.5 5.25 2.5 2.31 4.863 0 8 0s5.5 2.31 5.5 5.25c0 1.516-.701 2.5-1.328 3.259-.095.115-.184.22-.268.319-.207.245-.383.453-.541.681-.208.3-.33.565-.37.847a.751.751 0 0 1-1.485-.212c.084-.593.337-1.078.621-1.489.203-.292.45-.584.673-.848.075-.088.147-.173.213-.253.561-.679.985-1.32.985-2.304 0-2.06-1.637-3.75-4-3.75ZM5.75 12h4.5a.75.75 0 0 1 0 1.5h-4.5a.75.75 0 0 1 0-1.5ZM6 15.25a.75.75 0 0 1 .75-.75h2.5a.75.75 0 0 1 0 1.5h-2.5a.75.75 0 0 1-.75-.75Z",
+    "important": "M0 1.75C0 .784.784 0 1.75 0h12.5C15.216 0 16 .784 16 1.75v9.5A1.75 1.75 0 0 1 14.25 13H8.06l-2.573 2.573A1.458 1.458 0 0 1 3 14.543V13H1.75A1.75 1.75 0 0 1 0 11.25Zm1.75-.25a.25.25 0 0 0-.25.25v9.5c0 .138.112.25.25.25h2a.75.75 0 0 1 .75.75v2.19l2.72-2.72a.749.749 0 0 1 .53-.22h6.5a.25.25 0 0 0 .25-.25v-9.5a.25.25 0 0 0-.25-.25Zm7 2.25v2.5a.75.75 0 0 1-1.5 0v-2.5a.75.75 0 0 1 1.5 0ZM9 9a1 1 0 1 1-2 0 1 1 0 0 1 2 0Z",
+    "warning": "M6.457 1.047c.659-1.234 2.427-1.234 3.086 0l6.082 11.378A1.75 1.75 0 0 1 14.082 15H1.918a1.75 1.75 0 0 1-1.543-2.575Zm1.763.707a.25.25 0 0 0-.44 0L1.698 13.132a.25.25 0 0 0 .22.368h12.164a.25.25 0 0 0 .22-.368Zm.53 3.996v2.5a.75.75 0 0 1-1.5 0v-2.5a.75.75 0 0 1 1.5 0ZM9 11a1 1 0 1 1-2 0 1 1 0 0 1 2 0Z",
+    "caution": "M4.47.22A.749.749 0 0 1 5 0h6c.199 0 .389.079.53.22l4.25 4.25c.141.14.22.331.22.53v6a.749.749 0 0 1-.22.53l-4.25 4.25A.749.749 0 0 1 11 16H5a.749.749 0 0 1-.53-.22L.22 11.53A.749.749 0 0 1 0 11V5c0-.199.079-.389.22-.53Zm.84 1.28L1.5 5.31v5.38l3.81 3.81h5.38l3.81-3.81V5.31L10.69 1.5ZM8 4a.75.75 0 0 1 .75.75v3.5a.75.75 0 0 1-1.5 0v-3.5A.75.75 0 0 1 8 4Zm0 8a1 1 0 1 1 0-2 1 1 0 0 1 0 2Z",
 }
 
 ALERT_TITLES: dict[str, str] = {
@@ -34,10 +35,147 @@ ALERT_TITLES: dict[str, str] = {
     "caution": "Caution",
 }
 
+# Per-user cache directory; rendered PDFs are kept in its "pdf" subfolder
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "md2pdf"
+
+# Size limit of the PDF cache; the least recently used PDFs are removed first
+PDF_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Connection details of a Chromium kept running by --keep-browser
+DAEMON_FILE = CACHE_DIR / "daemon.json"
+
+# Switches Playwright's launch() passes as well; in particular it disables
+# the sandbox, which does not work as root and in most containers
+DAEMON_CHROMIUM_ARGS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--hide-scrollbars",
+    "--mute-audio",
+)
+
+# Page setup passed to Playwright's page.pdf()
+PDF_OPTIONS = {
+    "format": "A4",
+    "print_background": True,
+    "display_header_footer": False,
+    "margin": {
+        "top": "15mm",
+        "bottom": "15mm",
+        "left": "15mm",
+        "right": "15mm",
+    },
+}
+
+# Page setup for WeasyPrint, matching PDF_OPTIONS
+WEASYPRINT_PAGE_CSS = (
+    f"@page {{ size: {PDF_OPTIONS['format']}; margin: "
+    + " ".join(PDF_OPTIONS["margin"][side] for side in ("top", "right", "bottom", "left"))
+    + "; }"
+)
+
+# Available PDF renderers, the first one is the default
+ENGINES = ("chromium", "weasyprint")
+
+# File name endings that mark a positional argument as a Markdown input
+MARKDOWN_SUFFIXES = (".md", ".markdown")
+
+# Upper bound for documents printed at the same time in batch mode
+MAX_CONCURRENT_PAGES = 4
+
+# MIME types of images that can be embedded as data URIs
+_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+    ".svg": "image/svg+xml",
+    ".ico": "image/x-icon",
+}
+
+# Candidate header line of a GitHub alert, e.g. "> [!NOTE]"; the type is
+# validated against ALERT_TITLES, which also makes it case-insensitive
+_ALERT_HEADER_RE = re.compile(r">\s*\[!([A-Za-z]+)\]\s*$")
+
+# Alert icon referencing the shared sprite, see _inline_alert_icons
+_ALERT_ICON_USE_RE = re.compile(r'<svg class="octicon" ([^>]*)><use href="#octicon-(\w+)"></use></svg>')
+
+# Quote marker of an alert body line, with at most one following whitespace
+# character ([^\S\n] so it never reaches into the next line)
+_ALERT_QUOTE_RE = re.compile(r"^>[^\S\n]?", re.MULTILINE)
+
+# Line break followed by a blank line, which would end a raw HTML block
+_BLANK_LINE_BREAK_RE = re.compile(r"\n(?=[ \t]*\n)")
+
+# Hidden SVG sprite holding one <symbol> per alert icon used in a document.
+# Alerts reference these via <use> so each path is embedded and parsed only
+# once per document.
+_ALERT_ICON_SPRITE_START = (
+    '<svg xmlns="http://www.w3.org/2000/svg" aria-hidden="true" '
+    'style="position: absolute; width: 0; height: 0; overflow: hidden">'
+)
+_ALERT_ICON_SYMBOLS = {
+    alert_type: f'<symbol id="octicon-{alert_type}" viewBox="0 0 16 16"><path d="{path}"></path></symbol>'
+    for alert_type, path in ALERT_ICON_PATHS.items()
+}
+
+# Opening HTML of each alert type up to its body, icon and title included
+_ALERT_OPENINGS = {
+    alert_type: (
+        f'\n<div class="markdown-alert markdown-alert-{alert_type}">\n'
+        '<p class="markdown-alert-title">'
+        f'<svg class="octicon" width="16" height="16"><use href="#octicon-{alert_type}"></use></svg>'
+        f"{title}</p>\n"
+    )
+    for alert_type, title in ALERT_TITLES.items()
+}
+
+# Indented list item, for the python-markdown fallback
+_LIST_INDENT_RE = re.compile(r'^( +)([-*]|\d+\.)\s')
+
+# Possible reference to a resource that is not embedded in the document
+# itself; errs on the side of matching, which only disables caching
+_EXTERNAL_RESOURCE_RE = re.compile(
+    r"""\s(?:src|data|poster|background)\s*=\s*(?!["']?\s*data:)"""
+    r"""|\ssrcset\s*=|<link\b|@import|url\(\s*(?!["']?\s*data:)""",
+    re.IGNORECASE,
+)
+
+# Helpers for deriving heading anchor ids
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATOR_RE = re.compile(r"[-\s]+")
+_FOOTNOTE_REF_RE = re.compile(r'<sup class="footnote-ref"[^>]*>.*?</sup>')
+
+# Helpers for minifying the embedded stylesheets
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE_RE = re.compile(r" ?([{};,>]) ?")
+
 
 class ThemeConfig:
     """Configuration class for theme settings loaded from themes.ini."""
 
+    # Settings that a theme section may override
+    _FIELDS = (
+        "name",
+        "university",
+        "address",
+        "email",
+        "website",
+        "slogan",
+        "accent_color",
+        "logo_left",
+        "logo_right",
+    )
+
     def __init__(self, theme_name: str = "Standard", config_path: Optional[str] = None):
         self.theme_name = theme_name
         self.config = configparser.ConfigParser()
@@ -64,17 +202,9 @@ class ThemeConfig:
 
     def _load_theme(self, theme_name: str) -> None:
         """Load theme settings from config file."""
-        if theme_name in self.config:
-            section = self.config[theme_name]
-            self.name = section.get("name", self.name)
-            self.university = section.get("university", self.university)
-            self.address = section.get("address", self.address)
-            self.email = section.get("email", self.email)
-            self.website = section.get("website", self.website)
-            self.slogan = section.get("slogan", self.slogan)
-            self.accent_color = section.get("accent_color", self.accent_color)
-            self.logo_left = section.get("logo_left", self.logo_left)
-            self.logo_right = section.get("logo_right", self.logo_right)
+        section = dict(self.config[theme_name]) if theme_name in self.config else {}
+        for field in self._FIELDS:
+            setattr(self, field, section.get(field, getattr(self, field)))
 
         if "DEFAULT" in self.config:
             self.heading_line_color = self.config["DEFAULT"].get(
@@ -82,27 +212,74 @@ class ThemeConfig:
             )
 
 
-def install_dependencies() -> None:
-    """Checks for required packages and installs them if missing."""
-    print("Checking system dependencies...")
-    for package in ["markdown", "playwright"]:
+def _major_version(version: str) -> int:
+    """Returns the major number of a version string such as "3.0.2"."""
+    major = re.match(r"\d*", version).group()
+    return int(major) if major else 0
+
+
+def _child_stdout():
+    """
+    Returns the stdout for installer subprocesses.
+
+    main() sends status messages to stderr while the PDF is written to
+    stdout, and the installers' output has to follow. Otherwise None lets
+    them inherit stdout, which also works when sys.stdout is not a real file.
+    """
+    return sys.stderr if sys.stdout is sys.stderr else None
+
+
+def install_dependencies(engine: str = ENGINES[0]) -> None:
+    """
+    Checks for required packages and installs them if missing.
+
+    Args:
+        engine: PDF renderer that will be used, one of ENGINES.
+    """
+    import importlib
+    import importlib.metadata
+    import importlib.util
+
+    def is_usable(package: str, min_major: int) -> bool:
+        # find_spec and the metadata only locate the package without
+        # importing (and thus executing) it
+        if importlib.util.find_spec(package) is None:
+            return False
+        if not min_major:
+            return True
         try:
-            __import__(package)
-        except ImportError:
+            return _major_version(importlib.metadata.version(package)) >= min_major
+        except importlib.metadata.PackageNotFoundError:
+            return False
+
+    # Each requirement lists interchangeable packages with the lowest usable
+    # major version; the first one is installed only if none of them is usable
+    renderer = "playwright" if engine == "chromium" else engine
+    for alternatives in [(("mistune", 3), ("markdown", 0)), ((renderer, 0),)]:
+        if not any(is_usable(package, min_major) for package, min_major in alternatives):
+            import subprocess
+
+            package, min_major = alternatives[0]
+            if min_major:
+                package = f"{package}>={min_major}"
             print(f"Installing missing package: {package}...")
             subprocess.check_call(
-                [sys.executable, "-m", "pip", "install", package]
+                [sys.executable, "-m", "pip", "install", package],
+                stdout=_child_stdout(),
             )
+            # Let the running interpreter see the freshly installed package
+            importlib.invalidate_caches()
 
-    try:
-        from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            p.chromium.launch()
-    except Exception:
-        print("Installing Playwright browsers...")
-        subprocess.check_call(
-            [sys.executable, "-m", "playwright", "install", "chromium"]
-        )
+
+def install_browser() -> None:
+    """Downloads the Chromium build used by Playwright."""
+    import subprocess
+
+    print("Installing Playwright browsers...")
+    subprocess.check_call(
+        [sys.executable, "-m", "playwright", "install", "chromium"],
+        stdout=_child_stdout(),
+    )
 
 
 def load_image_as_base64(image_path: str, script_dir: Path) -> Optional[str]:
@@ -121,29 +298,37 @@ def load_image_as_base64(image_path: str, script_dir: Path) -> Optional[str]:
         print(f"Warning: Image not found: {path}")
         return None
 
-    with open(path, "rb") as f:
-        data = base64.b64encode(f.read()).decode("utf-8")
-
-    ext = path.suffix.lower()
-    mime_types = {
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".webp": "image/webp",
-        ".svg": "image/svg+xml",
-    }
-    mime = mime_types.get(ext, "image/png")
+    data = binascii.b2a_base64(path.read_bytes(), newline=False).decode("ascii")
+
+    mime = _MIME_TYPES.get(path.suffix.lower(), "image/png")
     return f"data:{mime};base64,{data}"
 
 
+def _minify_css(css: str) -> str:
+    """
+    Strips comments and redundant whitespace from a stylesheet.
+
+    Args:
+        css: Stylesheet source.
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_SPACE_RE.sub(r"\1", css)
+    return css.replace(": ", ":").replace(";}", "}").strip()
+
+
+@functools.lru_cache(maxsize=8)
 def get_github_css(heading_line_color: str = "#d1d9e0") -> str:
     """
     Returns CSS for GitHub-style rendering.
 
+    The result is minified and cached per heading color, so batch
+    conversions format the stylesheet only once.
+
     Args:
         heading_line_color: Color for heading underline.
     """
-    return f"""
+    return _minify_css(f"""
         * {{ box-sizing: border-box; }}
         html, body {{ margin: 0; padding: 0; background: #fff; }}
         body {{
@@ -197,6 +382,8 @@ def get_github_css(heading_line_color: str = "#d1d9e0") -> str:
         ul {{ list-style-type: disc; }}
         ol {{ list-style-type: decimal; }}
         li {{ margin-top: 0.25em; }}
+        .task-list-item {{ list-style-type: none; }}
+        .task-list-item input {{ margin: 0 0.2em 0.25em -1.4em; vertical-align: middle; }}
         li > ul, li > ol {{ padding-left: 2em; margin-top: 0; margin-bottom: 0; }}
         ul ul, ol ul {{ list-style-type: circle; }}
         ul ul ul, ol ul ul, ul ol ul, ol ol ul {{ list-style-type: square; }}
@@ -251,17 +438,18 @@ def get_github_css(heading_line_color: str = "#d1d9e0") -> str:
         .markdown-alert-caution {{ border-color: #cf222e; background-color: #ffebe9; }}
         .markdown-alert-caution .markdown-alert-title {{ color: #cf222e; }}
         .markdown-alert-caution .octicon {{ fill: #cf222e; }}
-    """
+    """)
 
 
-def get_iee_css(theme: ThemeConfig) -> str:
+@functools.lru_cache(maxsize=8)
+def get_iee_css(accent_color: str) -> str:
     """
     Returns CSS for IEE header/footer styling matching reference images.
 
     Args:
-        theme: Theme configuration.
+        accent_color: Theme accent color for lines and institute names.
     """
-    return f"""
+    return _minify_css(f"""
         body {{ padding-top: 12px; }}
 
         .iee-header {{
@@ -270,7 +458,7 @@ def get_iee_css(theme: ThemeConfig) -> str:
             justify-content: space-between;
             padding-bottom: 8px;
             margin-bottom: 15px;
-            border-bottom: 1px solid {theme.accent_color};
+            border-bottom: 1px solid {accent_color};
         }}
         .iee-header-left {{
             display: flex;
@@ -286,7 +474,7 @@ def get_iee_css(theme: ThemeConfig) -> str:
             line-height: 1.3;
         }}
         .iee-header-title .inst-name {{
-            color: {theme.accent_color};
+            color: {accent_color};
             font-weight: 600;
             font-size: 11px;
         }}
@@ -301,7 +489,7 @@ def get_iee_css(theme: ThemeConfig) -> str:
         .iee-footer {{
             margin-top: 25px;
             padding-top: 8px;
-            border-top: 1px solid {theme.accent_color};
+            border-top: 1px solid {accent_color};
             font-size: 9px;
             color: #666;
             display: flex;
@@ -312,19 +500,36 @@ def get_iee_css(theme: ThemeConfig) -> str:
             line-height: 1.5;
         }}
         .iee-footer-left .univ {{
-            color: {theme.accent_color};
+            color: {accent_color};
             font-weight: 600;
         }}
         .iee-footer-left .inst {{
-            color: {theme.accent_color};
+            color: {accent_color};
         }}
         .iee-footer-right {{
             text-align: right;
-            color: {theme.accent_color};
+            color: {accent_color};
             font-style: italic;
             font-size: 8px;
         }}
+    """)
+
+
+@functools.lru_cache(maxsize=8)
+def get_document_css(
+        heading_line_color: str, accent_color: Optional[str] = None
+) -> str:
+    """
+    Returns the complete stylesheet of a document, cached per color pair.
+
+    Args:
+        heading_line_color: Color for heading underline.
+        accent_color: IEE accent color, or None for plain GitHub styling.
     """
+    css = get_github_css(heading_line_color)
+    if accent_color is not None:
+        css += get_iee_css(accent_color)
+    return css
 
 
 def get_iee_header(
@@ -374,12 +579,143 @@ def get_iee_footer(theme: ThemeConfig) -> str:
 """
 
 
+def _build_alert(alert_type: str, quoted_lines: list[str]) -> str:
+    """
+    Returns the HTML block for a single GitHub alert.
+
+    Args:
+        alert_type: Lowercase alert type, one of ALERT_TITLES.
+        quoted_lines: Alert body lines still carrying their ">" markers.
+    """
+    content = _ALERT_QUOTE_RE.sub("", "\n".join(quoted_lines)).strip()
+
+    # The body is Markdown of its own (paragraphs, lists, code blocks), so
+    # render it here. The result is passed through as one raw HTML block,
+    # which a blank line would end early; such line breaks become
+    # character references, which also keeps blank lines in code blocks.
+    body = _BLANK_LINE_BREAK_RE.sub("&#10;", convert_markdown_to_html(content).strip())
+
+    # Create HTML block - this will be preserved by the markdown parser
+    return f"{_ALERT_OPENINGS[alert_type]}{body}\n</div>\n"
+
+
+def preprocess_github_alerts(markdown_content: str) -> str:
+    """
+    Converts GitHub-style alerts to HTML placeholders before Markdown processing.
+
+    Handles alerts like:
+    > [!NOTE]
+    > Content here
+
+    Args:
+        markdown_content: Raw Markdown text.
+
+    Returns:
+        Markdown with alerts converted to HTML divs.
+    """
+    # Most documents contain no alerts at all; a substring search is far
+    # cheaper than splitting and scanning every line
+    if "[!" not in markdown_content:
+        return markdown_content
+
+    lines = markdown_content.split("\n")
+    result = []
+    i = 0
+
+    # Single forward pass: a header line starts an alert that extends over
+    # all directly following blockquote lines
+    while i < len(lines):
+        match = _ALERT_HEADER_RE.match(lines[i])
+        alert_type = match.group(1).lower() if match else None
+        if alert_type not in ALERT_TITLES:
+            result.append(lines[i])
+            i += 1
+            continue
+
+        # Blank lines between the header and the body are allowed
+        start = i + 1
+        while start < len(lines) and (not lines[start] or lines[start].isspace()):
+            start += 1
+        end = start
+        while end < len(lines) and lines[end].startswith(">"):
+            end += 1
+        if end == start:
+            # A header without body is left as the blockquote it is
+            result.append(lines[i])
+            i += 1
+            continue
+        result.append(_build_alert(alert_type, lines[start:end]))
+        i = end
+
+    return "\n".join(result)
+
+
+def _add_heading_ids(md, state) -> None:
+    """
+    mistune render hook that gives every heading a unique anchor id.
+
+    Like python-markdown's toc extension, it also replaces paragraphs
+    consisting of "[TOC]" with a nested list linking to all headings.
+
+    Ids follow python-markdown's toc extension ("my-heading", "my-heading_1",
+    accents folded to ASCII, derived from the rendered text without markup),
+    so existing links into converted documents keep working. Headings nested
+    in lists or blockquotes are included.
+
+    Args:
+        md: mistune Markdown instance.
+        state: Parsed block state of the current document.
+    """
+    import html
+    import unicodedata
+
+    from mistune.core import BlockState
+    from mistune.toc import render_toc_ul
+    from mistune.util import striptags
+
+    used_ids = set()
+    toc_items = []
+    toc_markers = []
+    pending = list(reversed(state.tokens))
+    # Depth-first in document order, like the toc extension's tree walk
+    while pending:
+        token = pending.pop()
+        if "children" in token:
+            pending.extend(reversed(token["children"]))
+        if token["type"] == "paragraph" and token.get("text", "").strip() == "[TOC]":
+            toc_markers.append(token)
+        if token["type"] != "heading":
+            continue
+        # Inline markup is only parsed while rendering, so render the heading
+        # text on its own; link targets and emphasis markers must not leak in
+        rendered = md.renderer(md.inline(token["text"], state.env), BlockState())
+        rendered = _FOOTNOTE_REF_RE.sub("", rendered)
+        text = html.unescape(striptags(rendered))
+        slug = unicodedata.normalize("NFKD", text)
+        slug = slug.encode("ascii", "ignore").decode("ascii")
+        slug = _SLUG_STRIP_RE.sub("", slug).strip().lower()
+        slug = _SLUG_SEPARATOR_RE.sub("-", slug)
+        unique_id, counter = slug, 0
+        while unique_id in used_ids or not unique_id:
+            counter += 1
+            unique_id = f"{slug}_{counter}"
+        used_ids.add(unique_id)
+        token["attrs"]["id"] = unique_id
+        toc_items.append((token["attrs"]["level"], unique_id, html.escape(text, quote=False)))
+
+    if toc_markers:
+        toc_html = f'<div class="toc">\n{render_toc_ul(toc_items)}</div>'
+        for token in toc_markers:
+            token.clear()
+            token.update(type="block_html", raw=toc_html)
+
+
 def normalize_list_indentation(markdown_content: str) -> str:
     """
     Normalizes 2-space list indentation to 4-space for Python markdown compatibility.
 
     GitHub allows 2-space indentation for nested lists, but Python's markdown
-    library requires 4 spaces.
+    library requires 4 spaces. Only needed for the python-markdown fallback.
 
     Args:
         markdown_content: Raw Markdown text.
@@ -392,7 +728,7 @@ def normalize_list_indentation(markdown_content: str) -> str:
 
     for line in lines:
         # Match lines that start with spaces followed by a list marker (- or * or 1.)
-        match = re.match(r'^( +)([-*]|\d+\.)\s', line)
+        match = _LIST_INDENT_RE.match(line)
         if match:
             spaces = match.group(1)
             # Convert 2-space indentation levels to 4-space
@@ -404,51 +740,55 @@ def normalize_list_indentation(markdown_content: str) -> str:
     return '\n'.join(result)
 
 
-def preprocess_github_alerts(markdown_content: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _get_markdown() -> Callable[[str], str]:
     """
-    Converts GitHub-style alerts to HTML placeholders before Markdown processing.
+    Returns the shared Markdown converter, creating it on first use.
 
-    Handles alerts like:
-    > [!NOTE]
-    > Content here
-
-    Args:
-        markdown_content: Raw Markdown text.
-
-    Returns:
-        Markdown with alerts converted to HTML divs.
+    Uses mistune 3 when it is installed and falls back to python-markdown,
+    also if only an older mistune with a different API is available.
     """
-    pattern = re.compile(
-        r"^>\s*\[!(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]\s*\n((?:>.*(?:\n|$))*)",
-        re.MULTILINE | re.IGNORECASE,
-    )
-
-    def replace_alert(match: re.Match) -> str:
-        alert_type = match.group(1).lower()
-        content_block = match.group(2)
-        clean_lines = [
-            re.sub(r"^>\s?", "", line) for line in content_block.split("\n")
-        ]
-        content = "\n".join(clean_lines).strip()
-
-        icon = ALERT_ICONS.get(alert_type, "")
-        title = ALERT_TITLES.get(alert_type, alert_type.capitalize())
+    try:
+        import mistune
+    except ImportError:
+        mistune = None
+
+    if mistune is None or _major_version(mistune.__version__) < 3:
+        import markdown
+
+        # Configure Markdown with GitHub-like extensions
+        python_md = markdown.Markdown(
+            extensions=[
+                "fenced_code",  # ```code blocks```
+                "tables",  # GitHub tables
+                "toc",  # Table of contents
+                "nl2br",  # Newlines to <br>
+                "sane_lists",  # Better list handling
+            ]
+        )
 
-        # Create HTML block - this will be preserved by the markdown parser
-        return f"""
-<div class="markdown-alert markdown-alert-{alert_type}">
-<p class="markdown-alert-title">{icon}{title}</p>
-<p>{content}</p>
-</div>
+        def convert(markdown_content: str) -> str:
+            python_md.reset()
+            return python_md.convert(normalize_list_indentation(markdown_content))
 
-"""
+        return convert
 
-    return pattern.sub(replace_alert, markdown_content)
+    # Configure mistune with GitHub-like syntax; raw HTML is passed through
+    # and single newlines become <br>
+    md = mistune.create_markdown(
+        escape=False,
+        hard_wrap=True,
+        plugins=["table", "strikethrough", "task_lists", "footnotes", "url"],
+    )
+    md.before_render_hooks.append(_add_heading_ids)
+    return md
 
 
 def convert_markdown_to_html(markdown_content: str) -> str:
     """
-    Converts Markdown to HTML using Python's Markdown library.
+    Converts Markdown to HTML using mistune, or python-markdown as fallback.
+
+    The converter is set up once per process and reused for every document.
 
     Args:
         markdown_content: Preprocessed Markdown text.
@@ -456,50 +796,39 @@ def convert_markdown_to_html(markdown_content: str) -> str:
     Returns:
         HTML content.
     """
-    import markdown
-
-    # Configure Markdown with GitHub-like extensions
-    md = markdown.Markdown(
-        extensions=[
-            "fenced_code",  # ```code blocks```
-            "tables",  # GitHub tables
-            "toc",  # Table of contents
-            "nl2br",  # Newlines to <br>
-            "sane_lists",  # Better list handling
-        ]
-    )
+    return _get_markdown()(markdown_content)
 
-    html_body = md.convert(markdown_content)
 
-    return html_body
-
-
-def create_html_document(
-        body: str,
+def build_doc_template(
         theme: Optional[ThemeConfig] = None,
         script_dir: Optional[Path] = None,
-) -> str:
+) -> tuple[str, str]:
     """
-    Creates complete HTML document with optional IEE styling.
+    Builds the parts of the HTML document that surround the body.
+
+    They only depend on the theme, so batch conversions build them, including
+    the base64-encoded logos, once and reuse them for every document.
 
     Args:
-        body: HTML body content.
         theme: Theme configuration for IEE styling.
         script_dir: Directory of the script for locating resources.
+
+    Returns:
+        Tuple of (prefix, suffix); a document is prefix + body + suffix.
     """
     heading_color = theme.heading_line_color if theme else "#d1d9e0"
-    css = get_github_css(heading_color)
+    accent_color = theme.accent_color if theme and script_dir else None
+    css = get_document_css(heading_color, accent_color)
     header, footer = "", ""
 
     if theme and script_dir:
-        css += get_iee_css(theme)
         logo_left = load_image_as_base64(theme.logo_left, script_dir)
         logo_right = load_image_as_base64(theme.logo_right, script_dir)
         if logo_left and logo_right:
             header = get_iee_header(theme, logo_left, logo_right)
             footer = get_iee_footer(theme)
 
-    return f"""<!DOCTYPE html>
+    prefix = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -508,26 +837,60 @@ def create_html_document(
 </head>
 <body>
 {header}
-{body}
+"""
+    suffix = f"""
 {footer}
 </body>
 </html>"""
+    return prefix, suffix
 
 
-def convert_and_style(
-        input_file: str,
-        temp_html: str,
+def create_html_document(
+        body: str,
         theme: Optional[ThemeConfig] = None,
         script_dir: Optional[Path] = None,
-) -> None:
+        template: Optional[tuple[str, str]] = None,
+) -> str:
     """
-    Converts Markdown to styled HTML.
+    Creates complete HTML document with optional IEE styling.
 
     Args:
-        input_file: Path to input Markdown file.
-        temp_html: Path for output temporary HTML file.
+        body: HTML body content.
         theme: Theme configuration for IEE styling.
         script_dir: Directory of the script for locating resources.
+        template: Prebuilt result of build_doc_template; theme and script_dir
+            are ignored when given.
+    """
+    prefix, suffix = template or build_doc_template(theme, script_dir)
+
+    # Alert icons reference the shared sprite, so only include it, and only
+    # the icons actually referenced, when needed
+    sprite = ""
+    if 'class="markdown-alert ' in body:
+        symbols = [
+            symbol
+            for alert_type, symbol in _ALERT_ICON_SYMBOLS.items()
+            if f'href="#octicon-{alert_type}"' in body
+        ]
+        if symbols:
+            sprite = "".join((_ALERT_ICON_SPRITE_START, *symbols, "</svg>"))
+
+    # After the body, so the sprite does not become its first child and
+    # break :first-child rules; <use> references work from anywhere
+    return "".join((prefix, body, sprite, suffix))
+
+
+def convert_markdown_file(input_file: str) -> str:
+    """
+    Reads a Markdown file and converts it to an HTML body.
+
+    Module-level so batch conversions can run it in worker processes.
+
+    Args:
+        input_file: Path to input Markdown file.
+
+    Returns:
+        HTML content.
     """
     print(f"Converting '{input_file}' to HTML...")
 
@@ -535,56 +898,498 @@ def convert_and_style(
     with open(input_file, "r", encoding="utf-8") as f:
         md_content = f.read()
 
-    normalized = normalize_list_indentation(md_content)
-    processed = preprocess_github_alerts(normalized)
-    html_body = convert_markdown_to_html(processed)
-    html_doc = create_html_document(html_body, theme, script_dir)
+    processed = preprocess_github_alerts(md_content)
+    return convert_markdown_to_html(processed)
+
 
-    with open(temp_html, "w", encoding="utf-8") as f:
-        f.write(html_doc)
+def convert_and_style(
+        input_file: str,
+        theme: Optional[ThemeConfig] = None,
+        script_dir: Optional[Path] = None,
+) -> str:
+    """
+    Converts Markdown to styled HTML.
+
+    Args:
+        input_file: Path to input Markdown file.
+        theme: Theme configuration for IEE styling.
+        script_dir: Directory of the script for locating resources.
+
+    Returns:
+        Complete HTML document.
+    """
+    html_body = convert_markdown_file(input_file)
+    return create_html_document(html_body, theme, script_dir)
+
+
+class RenderSpec(NamedTuple):
+    """A single HTML document to be printed to PDF."""
+
+    html_doc: str
+    pdf_file: str
+    base_dir: Path
+    cache_file: Optional[Path] = None
+
+
+def write_pdf(pdf_file: str, pdf_data: bytes) -> None:
+    """
+    Writes PDF content to a file, or to standard output if the name is "-".
+
+    Args:
+        pdf_file: Path for output PDF file, or "-".
+        pdf_data: PDF file content.
+    """
+    if pdf_file == "-":
+        # Use the process' real stdout, even while status messages are
+        # redirected elsewhere
+        sys.__stdout__.flush()
+        sys.__stdout__.buffer.write(pdf_data)
+        sys.__stdout__.buffer.flush()
+    else:
+        Path(pdf_file).write_bytes(pdf_data)
+
+
+def _store_pdf(spec: RenderSpec, pdf_data: bytes) -> None:
+    """Writes a freshly printed PDF to its output and, if set, its cache file."""
+    write_pdf(spec.pdf_file, pdf_data)
+    if spec.cache_file is not None:
+        import tempfile
+
+        # Write under a unique name and rename, so an interrupted or
+        # concurrent run never leaves a truncated PDF behind as a cache hit
+        temp_name = None
+        try:
+            spec.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                    dir=spec.cache_file.parent, suffix=".tmp", delete=False
+            ) as f:
+                temp_name = f.name
+                f.write(pdf_data)
+            os.replace(temp_name, spec.cache_file)
+        except OSError as e:
+            # The PDF itself is written, only caching it failed
+            if temp_name is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_name)
+            print(f"Warning: Could not cache '{spec.pdf_file}': {e}")
+
+
+async def _print_to_pdf_async(page, spec: RenderSpec) -> bytes:
+    """
+    Prints one HTML document to PDF on an already opened page.
+
+    Args:
+        page: Playwright page, used for this document only.
+        spec: Document to print.
+
+    Returns:
+        The PDF file content.
+    """
+    # Start from a file:// page so relative image paths can be loaded,
+    # then replace its content with the document in memory
+    await page.goto(spec.base_dir.absolute().as_uri())
+    await page.set_content(spec.html_doc, wait_until="load")
+
+    # Wait until the fonts are actually laid out instead of a fixed delay
+    await page.evaluate("async () => { await document.fonts.ready; }")
+
+    return await page.pdf(**PDF_OPTIONS)
+
+
+async def _start_browser_daemon(executable_path: str) -> str:
+    """
+    Starts a detached headless Chromium that outlives this process.
+
+    Its DevTools endpoint is recorded in DAEMON_FILE so later runs can
+    connect to it instead of launching a browser of their own. The
+    endpoint is not authenticated, so any local user can control the
+    browser while it runs; DAEMON_FILE is only readable by the owner.
+
+    Args:
+        executable_path: Chromium executable to start.
+
+    Returns:
+        The DevTools endpoint URL of the new browser.
+
+    Raises:
+        RuntimeError: If Chromium exits or does not start in time.
+    """
+    import asyncio
+    import json
+    import subprocess
+
+    profile_dir = CACHE_DIR / "daemon-profile"
+    profile_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Chromium writes the port it picked for --remote-debugging-port=0 here
+    port_file = profile_dir / "DevToolsActivePort"
+    port_file.unlink(missing_ok=True)
+
+    process = subprocess.Popen(
+        [
+            executable_path,
+            *DAEMON_CHROMIUM_ARGS,
+            "--remote-debugging-port=0",
+            f"--user-data-dir={profile_dir}",
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    for _ in range(200):
+        if process.poll() is not None:
+            raise RuntimeError("Chromium exited before it was ready")
+        try:
+            port, _, _ = port_file.read_text().partition("\n")
+        except OSError:
+            port = ""
+        if port.isdigit():
+            break
+        await asyncio.sleep(0.05)
+    else:
+        process.kill()
+        raise RuntimeError("Timed out waiting for Chromium to start")
+
+    endpoint = f"http://127.0.0.1:{port}"
+    # Recreate the file so the owner-only mode also applies when it existed
+    DAEMON_FILE.unlink(missing_ok=True)
+    fd = os.open(DAEMON_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump({"endpoint": endpoint, "pid": process.pid}, f)
+    print("Started a background browser for later runs (stop it with --stop-browser)")
+    return endpoint
+
+
+async def _connect_browser_daemon(p):
+    """
+    Connects to the browser started by --keep-browser, if there is one.
+
+    A DAEMON_FILE whose browser no longer answers is removed.
+
+    Args:
+        p: Running Playwright instance.
+
+    Returns:
+        The connected browser, or None.
+    """
+    import json
+
+    from playwright.async_api import Error
+
+    try:
+        endpoint = json.loads(DAEMON_FILE.read_text())["endpoint"]
+    except (OSError, ValueError, KeyError):
+        return None
+    try:
+        return await p.chromium.connect_over_cdp(endpoint, timeout=5000)
+    except Error:
+        DAEMON_FILE.unlink(missing_ok=True)
+        return None
+
+
+async def _render_batch(
+        specs: list[RenderSpec],
+        max_pages: int = MAX_CONCURRENT_PAGES,
+        keep_browser: bool = False,
+) -> None:
+    """
+    Prints several HTML documents to PDF concurrently with one browser instance.
+
+    All documents share one browser context and get a page of their own.
+    A browser left running by an earlier --keep-browser run is reused,
+    otherwise Chromium is launched for this batch, or started in the
+    background if keep_browser is set. Chromium is installed first if
+    Playwright cannot find its executable, which avoids a separate test launch.
+
+    Args:
+        specs: Documents to print.
+        max_pages: Maximum number of pages rendered at the same time.
+        keep_browser: Leave the browser running for later runs.
+
+    Raises:
+        RuntimeError: If any document could not be printed; each failure
+            is reported before.
+    """
+    import asyncio
+
+    from playwright.async_api import Error, async_playwright
+
+    semaphore = asyncio.Semaphore(max_pages)
+    loop = asyncio.get_running_loop()
+
+    async def render(spec: RenderSpec) -> None:
+        async with semaphore:
+            print(f"Printing to '{spec.pdf_file}'...")
+            page = await context.new_page()
+            try:
+                pdf_data = await _print_to_pdf_async(page, spec)
+            finally:
+                await page.close()
+        # Write in a worker thread, the page slot is already free for the next document
+        await loop.run_in_executor(None, _store_pdf, spec, pdf_data)
+        print(f"✅ PDF created: {spec.pdf_file}")
+
+    async with async_playwright() as p:
+        browser = await _connect_browser_daemon(p)
+        if browser is None:
+            if not Path(p.chromium.executable_path).exists():
+                install_browser()
+            if keep_browser:
+                try:
+                    endpoint = await _start_browser_daemon(p.chromium.executable_path)
+                    browser = await p.chromium.connect_over_cdp(endpoint)
+                except (OSError, RuntimeError, Error) as e:
+                    print(f"Warning: Could not keep a background browser ({e}), launching one for this run")
+            if browser is None:
+                browser = await p.chromium.launch()
+        try:
+            context = await browser.new_context()
+            try:
+                # Let every document finish before the context is closed,
+                # even if others fail
+                results = await asyncio.gather(
+                    *(render(spec) for spec in specs), return_exceptions=True
+                )
+            finally:
+                await context.close()
+        finally:
+            # For a connected browser this only disconnects
+            await browser.close()
+
+    failures = 0
+    for spec, result in zip(specs, results):
+        if isinstance(result, BaseException):
+            failures += 1
+            print(f"Error: Could not create '{spec.pdf_file}': {result}")
+    if failures:
+        raise RuntimeError(f"{failures} of {len(specs)} PDF(s) could not be created")
+
+
+def _run_render_batch(
+        specs: list[RenderSpec],
+        max_pages: int = MAX_CONCURRENT_PAGES,
+        keep_browser: bool = False,
+) -> None:
+    """Runs _render_batch to completion in a fresh event loop."""
+    # asyncio is imported here as it dominates the module's import time
+    import asyncio
+
+    asyncio.run(_render_batch(specs, max_pages, keep_browser))
 
 
-def print_to_pdf(html_file: str, pdf_file: str) -> None:
+def _inline_alert_icons(html_doc: str) -> str:
+    """
+    Replaces references to the alert icon sprite with the icons themselves.
+
+    WeasyPrint draws every inline <svg> as a document of its own, so a <use>
+    cannot reach the <symbol> elements of the shared sprite.
+    """
+    return _ALERT_ICON_USE_RE.sub(
+        lambda match: (
+            f'<svg class="octicon" {match.group(1)} viewBox="0 0 16 16">'
+            f'<path d="{ALERT_ICON_PATHS[match.group(2)]}"></path></svg>'
+        ),
+        html_doc,
+    )
+
+
+def _render_batch_weasyprint(specs: list[RenderSpec]) -> None:
+    """
+    Renders HTML documents to PDF with WeasyPrint, without a browser.
+
+    Args:
+        specs: Documents to render.
+    """
+    from weasyprint import CSS, HTML
+
+    page_css = CSS(string=WEASYPRINT_PAGE_CSS)
+    for spec in specs:
+        print(f"Rendering '{spec.pdf_file}'...")
+        # base_url makes relative image paths resolve like on the file:// page
+        document = HTML(
+            string=_inline_alert_icons(spec.html_doc),
+            base_url=str(spec.base_dir.absolute()),
+        )
+        _store_pdf(spec, document.write_pdf(stylesheets=[page_css]))
+        print(f"✅ PDF created: {spec.pdf_file}")
+
+
+async def _stop_browser_daemon_async() -> bool:
+    """Closes the browser started by --keep-browser through DevTools."""
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await _connect_browser_daemon(p)
+        if browser is None:
+            return False
+        session = await browser.new_browser_cdp_session()
+        await session.send("Browser.close")
+    DAEMON_FILE.unlink(missing_ok=True)
+    return True
+
+
+def stop_browser_daemon() -> bool:
+    """
+    Stops the browser left running by --keep-browser.
+
+    Returns:
+        True if a running browser was stopped.
+    """
+    import asyncio
+
+    if not DAEMON_FILE.exists():
+        return False
+    return asyncio.run(_stop_browser_daemon_async())
+
+
+def print_to_pdf(
+        html_doc: str, pdf_file: str, base_dir: Optional[Path] = None
+) -> None:
     """
     Converts HTML to PDF using Playwright.
 
     Args:
-        html_file: Path to input HTML file.
+        html_doc: Complete HTML document.
         pdf_file: Path for output PDF file.
+        base_dir: Directory that relative links resolve against
+            (defaults to the current working directory).
     """
-    from playwright.sync_api import sync_playwright
+    _run_render_batch([RenderSpec(html_doc, pdf_file, base_dir or Path.cwd())])
+
 
-    print(f"Printing to '{pdf_file}'...")
+def _pdf_cache_path(spec: RenderSpec, engine: str = ENGINES[0]) -> Optional[Path]:
+    """
+    Returns the cache location of the PDF rendered from a document.
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
+    The key is a hash of the complete HTML document, so it covers the
+    Markdown, theme, logos and stylesheet at once. Documents that load
+    images, stylesheets or other resources from disk or the web are not
+    cached, as those could change without the HTML changing.
 
-        # Use proper file:// URL format
-        file_path = os.path.abspath(html_file)
-        file_url = (
-            f"file:///{file_path.replace(os.sep, '/')}"
-            if os.name == "nt"
-            else f"file://{file_path}"
-        )
-        page.goto(file_url)
-
-        # Wait for fonts and styles to render
-        page.wait_for_timeout(1500)
-
-        page.pdf(
-            path=pdf_file,
-            format="A4",
-            print_background=True,
-            display_header_footer=False,
-            margin={
-                "top": "15mm",
-                "bottom": "15mm",
-                "left": "15mm",
-                "right": "15mm",
-            },
+    Args:
+        spec: Document to print.
+        engine: PDF renderer, one of ENGINES.
+
+    Returns:
+        Path of the cached PDF, or None if the document cannot be cached.
+    """
+    import hashlib
+
+    if _EXTERNAL_RESOURCE_RE.search(spec.html_doc):
+        return None
+
+    digest = hashlib.blake2b(digest_size=20)
+    options = PDF_OPTIONS if engine == "chromium" else WEASYPRINT_PAGE_CSS
+    digest.update(repr((engine, options)).encode("utf-8"))
+    digest.update(spec.html_doc.encode("utf-8"))
+    return CACHE_DIR / "pdf" / f"{digest.hexdigest()}.pdf"
+
+
+def _prune_pdf_cache(max_bytes: int = PDF_CACHE_MAX_BYTES) -> None:
+    """
+    Removes the least recently used cached PDFs beyond a total size.
+
+    Temporary files left behind by runs that were killed while writing a
+    cache entry are removed as well, once they are an hour old.
+
+    Args:
+        max_bytes: Size the cache may keep.
+    """
+    import time
+
+    stale_before = time.time() - 3600
+    for path in (CACHE_DIR / "pdf").glob("*.tmp"):
+        with contextlib.suppress(OSError):
+            if path.stat().st_mtime < stale_before:
+                path.unlink()
+
+    entries = []
+    for path in (CACHE_DIR / "pdf").glob("*.pdf"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    # Oldest first; cache hits refresh the modification time
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def convert_batch(
+        jobs: list[tuple[str, str]],
+        theme: Optional[ThemeConfig] = None,
+        script_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        max_pages: int = MAX_CONCURRENT_PAGES,
+        keep_browser: bool = False,
+        engine: str = ENGINES[0],
+) -> None:
+    """
+    Converts several Markdown files to PDF with a single browser instance.
+
+    All documents are converted to HTML first, in parallel worker processes
+    when there is more than one, and then printed concurrently on pages of
+    one browser. Relative links resolve against the directory of the
+    respective Markdown file.
+
+    Args:
+        jobs: Pairs of (input Markdown file, output PDF file).
+        theme: Theme configuration for IEE styling.
+        script_dir: Directory of the script for locating resources.
+        use_cache: Reuse PDFs previously rendered from identical HTML.
+        max_pages: Maximum number of documents printed at the same time.
+        keep_browser: Leave the browser running for later runs.
+        engine: PDF renderer, one of ENGINES. WeasyPrint renders in this
+            process, one document after the other, and needs no browser.
+    """
+    input_files = [input_file for input_file, _ in jobs]
+    if len(input_files) > 1:
+        import multiprocessing
+
+        # Markdown conversion is CPU-bound Python code, so spread it over
+        # processes; the browser stays in this process
+        processes = min(len(input_files), os.cpu_count() or 1)
+        with multiprocessing.Pool(processes) as pool:
+            html_bodies = pool.map(convert_markdown_file, input_files)
+    else:
+        html_bodies = [convert_markdown_file(f) for f in input_files]
+
+    template = build_doc_template(theme, script_dir)
+    specs = [
+        RenderSpec(
+            create_html_document(html_body, template=template),
+            pdf_file,
+            Path(input_file).parent,
         )
-        browser.close()
+        for html_body, (input_file, pdf_file) in zip(html_bodies, jobs)
+    ]
+    if use_cache:
+        pending = []
+        for spec in specs:
+            cache_file = _pdf_cache_path(spec, engine)
+            if cache_file is not None and cache_file.exists():
+                write_pdf(spec.pdf_file, cache_file.read_bytes())
+                os.utime(cache_file)
+                print(f"✅ PDF created: {spec.pdf_file} (unchanged, from cache)")
+            else:
+                pending.append(spec._replace(cache_file=cache_file))
+        specs = pending
+
+    if not specs:
+        return
+    if engine == "weasyprint":
+        _render_batch_weasyprint(specs)
+    else:
+        # Chromium is only started if at least one document has to be printed
+        _run_render_batch(specs, max_pages, keep_browser)
+    if use_cache:
+        _prune_pdf_cache()
 
 
 def main() -> None:
@@ -592,8 +1397,11 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Convert Markdown to PDF with GitHub styling."
     )
-    parser.add_argument("input", help="Input markdown file")
-    parser.add_argument("output", nargs="?", help="Output PDF file (optional)")
+    parser.add_argument("inputs", nargs="*", help="Input markdown file(s)")
+    parser.add_argument(
+        "-o", "--output",
+        help="Output PDF file or - for stdout (single input only, defaults to input name with .pdf)",
+    )
     parser.add_argument(
         "--iee", action="store_true", help="Add IEE/TU Graz header and footer"
     )
@@ -601,30 +1409,91 @@ def main() -> None:
         "--theme", default="Standard", help="Theme name from themes.ini"
     )
     parser.add_argument("--config", default="themes.ini", help="Path to themes.ini config file")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Always render, ignoring previously generated PDFs"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=MAX_CONCURRENT_PAGES,
+        help=f"Number of documents printed at the same time (default: {MAX_CONCURRENT_PAGES})",
+    )
+    parser.add_argument(
+        "--engine", choices=ENGINES, default=ENGINES[0],
+        help=f"PDF renderer (default: {ENGINES[0]})",
+    )
+    parser.add_argument(
+        "--keep-browser", action="store_true",
+        help=(
+            "Keep Chromium running in the background so later runs start faster; "
+            "its unauthenticated DevTools port on 127.0.0.1 is usable by any local user"
+        ),
+    )
+    parser.add_argument(
+        "--stop-browser", action="store_true",
+        help="Stop the browser kept running by --keep-browser and exit",
+    )
     args = parser.parse_args()
 
-    input_path = args.input
-    output_path = args.output or f"{os.path.splitext(input_path)[0]}.pdf"
+    if args.stop_browser:
+        if stop_browser_daemon():
+            print("Stopped the background browser.")
+        else:
+            print("No background browser is running.")
+        return
+    if not args.inputs:
+        parser.error("the following arguments are required: inputs")
+
+    input_paths = args.inputs
+    output_path = args.output
+    # Keep supporting the original "md2pdf.py input.md output" form: a second
+    # positional is the output unless it is named like a Markdown file. This
+    # must not depend on which files exist, or a rerun would read the
+    # previous output as an input.
+    if (
+            output_path is None
+            and len(input_paths) == 2
+            and not input_paths[1].lower().endswith(MARKDOWN_SUFFIXES)
+    ):
+        input_paths, output_path = input_paths[:1], input_paths[1]
+    if output_path is not None and len(input_paths) > 1:
+        parser.error("an output file can only be given for a single input")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.keep_browser and args.engine != "chromium":
+        parser.error("--keep-browser requires the chromium engine")
     script_dir = Path(__file__).parent
 
-    if not os.path.exists(input_path):
-        print(f"Error: '{input_path}' not found.")
+    missing = [path for path in input_paths if not os.path.exists(path)]
+    if missing:
+        for path in missing:
+            print(f"Error: '{path}' not found.")
         sys.exit(1)
 
-    install_dependencies()
+    # With "-" stdout carries the PDF itself, so status messages go to stderr
+    status_stream = sys.stderr if output_path == "-" else sys.stdout
+    with contextlib.redirect_stdout(status_stream):
+        install_dependencies(args.engine)
 
-    theme = ThemeConfig(args.theme, args.config) if args.iee else None
-    temp_html = f"temp_{os.path.basename(input_path)}.html"
+        theme = ThemeConfig(args.theme, args.config) if args.iee else None
+        jobs = [
+            (path, output_path or f"{os.path.splitext(path)[0]}.pdf")
+            for path in input_paths
+        ]
 
-    try:
-        convert_and_style(input_path, temp_html, theme, script_dir)
-        print_to_pdf(temp_html, output_path)
-        print(f"✅ PDF created: {output_path}")
+        try:
+            convert_batch(
+                jobs,
+                theme,
+                script_dir,
+                use_cache=not args.no_cache,
+                max_pages=args.jobs,
+                keep_browser=args.keep_browser,
+                engine=args.engine,
+            )
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
         if args.iee:
             print("   (with IEE styling)")
-    finally:
-        if os.path.exists(temp_html):
-            os.remove(temp_html)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+"""Tests for the Markdown to HTML conversion of md2pdf."""
+
+import md2pdf
+
+
+def render(markdown_content: str) -> str:
+    """Converts Markdown like md2pdf does before styling the document."""
+    return md2pdf.convert_markdown_to_html(
+        md2pdf.preprocess_github_alerts(markdown_content)
+    )
+
+
+def alert_body(html: str) -> str:
+    """Returns the part of an alert after its title, up to its closing tag."""
+    _, _, rest = html.partition('class="markdown-alert-title"')
+    _, _, body = rest.partition("</p>\n")
+    return body.partition("\n</div>")[0]
+
+
+def test_alert_with_several_paragraphs():
+    html = render("> [!WARNING]\n> First\n>\n> Second\n\nAfter")
+
+    assert alert_body(html) == "<p>First</p>\n<p>Second</p>"
+    assert html.rstrip().endswith("<p>After</p>")
+
+
+def test_alert_with_list():
+    html = render("> [!NOTE]\n> - one\n> - two\n\nAfter")
+
+    body = alert_body(html)
+    assert body.startswith("<ul>") and body.endswith("</ul>")
+    assert "</div>" not in html.split("<li>two")[1].split("</li>")[0]
+    assert html.rstrip().endswith("<p>After</p>")
+
+
+def test_alert_with_code_block():
+    html = render("> [!TIP]\n> Use this:\n>\n> ```\n> code\n>\n> more\n> ```\n\nAfter")
+
+    assert "<pre><code>code&#10;\nmore\n</code></pre>" in alert_body(html)
+    assert html.rstrip().endswith("<p>After</p>")
+
+
+def test_heading_ids_match_python_markdown_toc():
+    html = render("## Setup [docs](http://x.org)\n\n# Übersicht\n\n# Übersicht\n")
+
+    assert '<h2 id="setup-docs">' in html
+    assert '<h1 id="ubersicht">' in html
+    assert '<h1 id="ubersicht_1">' in html
+
+
+def test_toc_marker_lists_headings():
+    html = render("[TOC]\n\n# First\n\n## Second\n")
+
+    toc = html.partition('<div class="toc">')[2].partition("</div>")[0]
+    assert '<a href="#first">First</a>' in toc
+    assert '<a href="#second">Second</a>' in toc
+    assert "[TOC]" not in html
+
+
+def test_alert_header_without_body_is_kept():
+    assert md2pdf.preprocess_github_alerts("> [!NOTE]") == "> [!NOTE]"
+    assert md2pdf.preprocess_github_alerts("> [!NOTE]\n\nText") == "> [!NOTE]\n\nText"
+
+
+def test_alert_body_after_blank_line():
+    html = render("> [!TIP]\n\n> Body")
+
+    assert alert_body(html) == "<p>Body</p>"